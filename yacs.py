@@ -6,10 +6,13 @@
 
 import os
 import os.path as op
+import sys
 import argparse
 import pathlib
+import pickle
+import weakref
 from copy import deepcopy
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import yaml
@@ -53,36 +56,70 @@ hits and save your line width)
 See README.md and ./examples directory for more usage hints.
 """
 
+# Prefer the libyaml-backed C loader/dumper when PyYAML is built against it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Parsed yaml contents keyed by abspath, each with the (mtime, size) of the
+# source file it was parsed from, so an edited file replaces its own entry
+_YAML_CACHE = {}
+
+# Memoized results of Config.merged_view(), at most _MAX_MERGED_VIEWS of them
+_MERGED_VIEWS = {}
+_MAX_MERGED_VIEWS = 16
+
+# Sentinel for absent keys, distinguishable from a None value
+_MISSING = object()
+
+# Leaf types that are safe to share between Config objects without copying
+_IMMUTABLE_TYPES = (bool, int, float, complex, str, bytes, type(None))
+
+
+class _PeekLoader(_YamlLoader, yaml.composer.Composer):
+    """ A yaml loader composing nodes on demand, used by Config.peek() """
+
+    def __init__(self, stream):
+        _YamlLoader.__init__(self, stream)
+        yaml.composer.Composer.__init__(self)
+
 
 class Config(OrderedDict):
 
+    # Instance states are kept in slots rather than a per-node __dict__
+    __slots__ = ('__immutable__', '__version__', '__sorted_keys__')
+
     def __init__(self, init=None, **kwargs):
         """
-        :param init: dict | yaml filepath | argparse.Namespace
+        :param init: dict | yaml filepath | yaml file object or bytes |
+            argparse.Namespace
+        :param kwargs: extra arguments passed to from_yaml() or
+            from_namespace(), e.g. use_cache or unknown_args
         """
 
-        self.__dict__['__immutable__'] = False
+        object.__setattr__(self, '__immutable__', False)
+        object.__setattr__(self, '__version__', 0)  # bumped on every mutation
+        object.__setattr__(self, '__sorted_keys__', None)
 
         if init is None:
             super().__init__()
         elif isinstance(init, dict):
             self.from_dict(init)
-        elif isinstance(init, str):
-            self.from_yaml(init)
         elif isinstance(init, argparse.Namespace):
             self.from_namespace(init, **kwargs)
+        elif isinstance(init, (str, pathlib.Path)) or self._is_yaml_stream(init):
+            self.from_yaml(init, **kwargs)
         else:
             raise TypeError(
                 f'Config could only be instantiated from a dict, a yaml '
-                f'filepath, or an argparse.Namespace object, but given a '
-                f'{type(init)} object'
+                f'filepath, a yaml file object or bytes, or an '
+                f'argparse.Namespace object, but given a {type(init)} object'
             )
 
     # ---------------- Immutability ----------------
 
     @property
     def is_frozen(self):
-        return self.__dict__['__immutable__']
+        return self.__immutable__
 
     def freeze(self):
         self._set_immutable(True)
@@ -105,39 +142,57 @@ class Config(OrderedDict):
             self.freeze()
 
     def _set_immutable(self, is_immutable):
-        """ Recursively set immutability. """
+        """ Set immutability over the whole tree, walked with a stack. """
 
-        def _recursively_set_immutable(obj):
+        stack = [self]
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, dict):
                 if isinstance(obj, Config):
-                    obj.__dict__['__immutable__'] = is_immutable
-                for v in obj.values():
-                    _recursively_set_immutable(v)
+                    object.__setattr__(obj, '__immutable__', is_immutable)
+                stack.extend(obj.values())
             elif isinstance(obj, (list, tuple)):
-                for item in obj:
-                    _recursively_set_immutable(item)
-
-        _recursively_set_immutable(self)
+                stack.extend(obj)
 
     # ---------------- Set & Get ----------------
 
     def __setattr__(self, key, value):
-        if self.is_frozen:
+        if self.__immutable__:
             raise AttributeError('attempted to modify an immutable Config')
-        self[key] = value
+        OrderedDict.__setitem__(self, key, value)
+        object.__setattr__(self, '__version__', self.__version__ + 1)
 
     def __setitem__(self, key, value):
-        if self.is_frozen:
+        if self.__immutable__:
             raise AttributeError('attempted to modify an immutable Config')
-        super().__setitem__(key, value)
+        OrderedDict.__setitem__(self, key, value)
+        object.__setattr__(self, '__version__', self.__version__ + 1)
+
+    def _unchecked_set(self, key, value):
+        """
+        Set an attribute bypassing the immutability check. Only for internal
+        construction and merging, where the Config is known to be mutable.
+        """
+        OrderedDict.__setitem__(self, key, value)
+        object.__setattr__(self, '__version__', self.__version__ + 1)
+
+    def _unchecked_update(self, items):
+        """
+        Bulk version of _unchecked_set() for (key, value) pairs, which skips
+        the per-key method call and bumps the version only once.
+        """
+        setitem = OrderedDict.__setitem__
+        for key, value in items:
+            setitem(self, key, value)
+        object.__setattr__(self, '__version__', self.__version__ + 1)
 
     def __getattr__(self, key):
-        if key in self:
-            return self[key]
-        else:
+        try:
+            return OrderedDict.__getitem__(self, key)
+        except KeyError:
             raise AttributeError(
                 f'attempted to access a non-existing attribute: {key}'
-            )
+            ) from None
 
     # ---------------- Input ----------------
 
@@ -150,27 +205,96 @@ class Config(OrderedDict):
         if not isinstance(dic, dict):
             raise TypeError(f'expected a dict, but given a {type(dic)}')
 
-        super().__init__(Config._from_dict(dic))
+        super().__init__(Config._from_dict(dic, copy_leaves=True))
         self.freeze()
 
-    def from_yaml(self, yaml_path):
-        """ Instantiation from a yaml file. """
+    def from_yaml(self, yaml_path, use_cache=False):
+        """
+        Instantiation from a yaml file.
+
+        :param yaml_path: path string | pathlib.Path object. An opened file
+            object or the raw bytes of a yaml are also accepted, in which
+            case they are parsed directly without any caching
+        :param use_cache: if set to True, the parsed contents will be
+            pickled into a '<yaml_path>.pkl' sidecar file, and subsequent
+            loads will read from the sidecar instead of parsing the yaml,
+            as long as the sidecar is not older than the yaml file
+        """
+
+        if self._is_yaml_stream(yaml_path):
+            super().__init__(Config._from_dict(yaml.load(yaml_path, Loader=_YamlLoader)))
+            self.freeze()
+            return
 
         if not isinstance(yaml_path, (str, pathlib.Path)):
             raise TypeError(
-                f'expected a path string or a pathlib.Path object, but given '
-                f'a {type(yaml_path)}'
+                f'expected a path string, a pathlib.Path object, a file '
+                f'object or bytes, but given a {type(yaml_path)}'
             )
 
         if not op.isfile(str(yaml_path)):
             raise FileNotFoundError(f'file {yaml_path} does not exist')
 
-        with open(yaml_path, 'r') as fp:
-            dic = yaml.safe_load(fp)
+        stat = os.stat(yaml_path)
+        abspath = op.abspath(yaml_path)
+        file_stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _YAML_CACHE.get(abspath)
+        if cached is not None and cached[0] == file_stamp:
+            dic = deepcopy(cached[1])
+        else:
+            dic = self._load_yaml(yaml_path, stat, use_cache)
+            # _from_dict() takes over the leaves, so the cache keeps its own copy
+            _YAML_CACHE[abspath] = (file_stamp, deepcopy(dic))
 
         super().__init__(Config._from_dict(dic))
         self.freeze()
 
+    @staticmethod
+    def clear_yaml_cache():
+        """ Drop all parsed yaml contents cached by from_yaml(). """
+        _YAML_CACHE.clear()
+
+    @staticmethod
+    def peek(yaml_path, keys):
+        """
+        Read the values of some top-level keys from a yaml file without
+        loading the whole file: parsing stops as soon as all the requested
+        keys are found. Useful to scan a bunch of yaml files for the one to
+        load.
+
+        >>> Config.peek('default_config.yaml', ['mode'])
+        {'mode': 'train'}
+
+        :param keys: top-level keys to read
+        :return: a regular dict holding the found keys and their values
+        """
+
+        if not op.isfile(str(yaml_path)):
+            raise FileNotFoundError(f'file {yaml_path} does not exist')
+
+        keys = set(keys)
+        found = {}
+
+        with open(yaml_path, 'rb') as fp:
+            loader = _PeekLoader(fp)
+            try:
+                for event in (yaml.StreamStartEvent, yaml.DocumentStartEvent, yaml.MappingStartEvent):
+                    if not loader.check_event(event):
+                        return found
+                    loader.get_event()
+
+                while len(found) < len(keys) and not loader.check_event(yaml.MappingEndEvent):
+                    key_node = loader.compose_node(None, None)
+                    value_node = loader.compose_node(None, None)
+                    if isinstance(key_node, yaml.ScalarNode):
+                        key = loader.construct_object(key_node)
+                        if key in keys:
+                            found[key] = loader.construct_object(value_node, deep=True)
+            finally:
+                loader.dispose()
+
+        return found
+
     def from_namespace(self, parsed_args, unknown_args=None):
         """
         Instantiation from an argparse.Namespace object.
@@ -240,8 +364,8 @@ class Config(OrderedDict):
         """
         Recursively merge from other object
 
-        :param other: Config object | dict | yaml filepath |
-            argparse.Namespace object
+        :param other: Config object | dict | yaml filepath | yaml file
+            object or bytes | argparse.Namespace object
         :param exclusive: if set to True, merging with new fields is forbidden
 
         Example:
@@ -287,7 +411,8 @@ class Config(OrderedDict):
 
         if isinstance(other, Config):
             pass
-        elif isinstance(other, (dict, str, pathlib.Path, argparse.Namespace)):
+        elif isinstance(other, (dict, str, pathlib.Path, argparse.Namespace)) or \
+                self._is_yaml_stream(other):
             other = Config(other)
         else:
             raise TypeError(
@@ -295,32 +420,87 @@ class Config(OrderedDict):
             )
 
         def _merge(source_cfg, other_cfg, excl, keep_existed, _cur_depth=1):
-            """ Recursively merge the new Config object into the source one """
-            with source_cfg.unfreeze(), other_cfg.unfreeze():
-                for k, v in other_cfg.items():
-                    if k not in source_cfg and excl and _cur_depth <= max_exclusive_depth:
-                        raise AttributeError(
-                            f'attempted to merge an attribute `{k}` that is not '
-                            f'found in the source Config. Set `exclusive` to False '
-                            f'if requires to add new attributes'
-                        )
-
-                    if isinstance(v, Config):
-                        if isinstance(source_cfg.get(k), Config):
-                            _merge(source_cfg[k], v, excl, keep_existed, _cur_depth=_cur_depth + 1)
-                        else:
-                            source_cfg[k] = v
+            """
+            Recursively merge the new Config object into the source one,
+            which must have been unfrozen by the caller
+            """
+
+            for k, v in other_cfg.items():
+                existing = source_cfg.get(k, _MISSING)
+                if existing is _MISSING and excl and _cur_depth <= max_exclusive_depth:
+                    raise AttributeError(
+                        f'attempted to merge an attribute `{k}` that is not '
+                        f'found in the source Config. Set `exclusive` to False '
+                        f'if requires to add new attributes'
+                    )
+
+                if isinstance(v, Config):
+                    if isinstance(existing, Config):
+                        _merge(existing, v, excl, keep_existed, _cur_depth=_cur_depth + 1)
                     else:
-                        source_cfg[k] = deepcopy(v)
+                        source_cfg._unchecked_set(k, v)
+                else:
+                    source_cfg._unchecked_set(k, self._copy_leaf(v))
+
+            if not keep_existed:
+                for k, v in list(source_cfg.items()):
+                    if k not in other_cfg and not isinstance(v, Config):
+                        source_cfg.remove(k)
+
+        with self.unfreeze():
+            _merge(self, other, exclusive, keep_existed_attr)
+
+    @classmethod
+    def merged_view(cls, *layers, **kwargs):
+        """
+        Merge a stack of Config objects, from the bottom layer (e.g. the
+        defaults) to the top one (e.g. command line overrides), into a new
+        Config. The result is memoized: as long as neither the layers nor
+        the result have been modified since the last call, the very same
+        Config object is returned without merging again.
 
-                if not keep_existed:
-                    source_keys = list(source_cfg.keys())
-                    for k in source_keys:
-                        if k not in other_cfg and \
-                                not isinstance(source_cfg[k], Config):
-                            source_cfg.remove(k)
+        >>> cfg = Config.merged_view(default_cfg, user_cfg, cmd_cfg)
 
-        _merge(self, other, exclusive, keep_existed_attr)
+        Note that only modifications through item/attribute assignment and
+        remove() are tracked, while in-place changes to mutable leaves
+        (e.g. appending to a list) are not.
+
+        :param layers: Config objects, in increasing priority
+        :param kwargs: extra arguments passed to merge()
+        """
+
+        if not layers:
+            raise ValueError('expected at least one Config object to merge')
+        for layer in layers:
+            if not isinstance(layer, Config):
+                raise TypeError(
+                    f'expected Config objects to merge, but given a {type(layer)}'
+                )
+
+        memo_key = (tuple(id(layer) for layer in layers), tuple(sorted(kwargs.items())))
+        stamps = tuple(layer._tree_version() for layer in layers)
+
+        memo = _MERGED_VIEWS.get(memo_key)
+        if memo is not None:
+            refs, memo_stamps, view, view_stamp = memo
+            # ids might have been reused by new objects after the old layers were freed
+            if all(ref() is layer for ref, layer in zip(refs, layers)) and \
+                    memo_stamps == stamps and view._tree_version() == view_stamp:
+                return view
+
+        view = layers[0].copy()
+        for layer in layers[1:]:
+            # merge() adopts children Configs missing in the view as they are,
+            # which would let the upper layers write into this one
+            view.merge(layer.copy(), **kwargs)
+
+        if memo_key not in _MERGED_VIEWS and len(_MERGED_VIEWS) >= _MAX_MERGED_VIEWS:
+            _MERGED_VIEWS.pop(next(iter(_MERGED_VIEWS)))
+        _MERGED_VIEWS[memo_key] = (
+            tuple(weakref.ref(layer) for layer in layers), stamps, view, view._tree_version()
+        )
+
+        return view
 
     # ---------------- Output ----------------
 
@@ -332,12 +512,8 @@ class Config(OrderedDict):
 
         def _recursively_to_dict(obj):
             if isinstance(obj, Config):
-                if alphabetical:
-                    obj = sorted(obj.items(), key=lambda x: x[0])
-                dic = dict(obj)
-                for k, v in dic.items():
-                    dic[k] = _recursively_to_dict(v)
-                return dic
+                items = [(k, obj[k]) for k in obj._sorted_keys()] if alphabetical else obj.items()
+                return {k: _recursively_to_dict(v) for k, v in items}
             elif isinstance(obj, (list, tuple)):
                 return tuple(_recursively_to_dict(item) for item in obj)
             else:
@@ -383,15 +559,18 @@ class Config(OrderedDict):
             raise TypeError('only yaml file is supported by dump() method')
 
         def _serialize(obj):
-            serializable_types = (bool, str, int, float, list, tuple, dict, set, type(None))
-            if not isinstance(obj, serializable_types):
-                return '{} <class \'{}\'>'.format(str(obj), obj.__class__.__name__)
-            elif isinstance(obj, dict):
-                return {k: _serialize(v) for k, v in obj.items()}
+            # the safe dumper only represents exact builtin types, so subclasses
+            # of them (e.g. IntEnum members, numpy scalars) are stringified too
+            if isinstance(obj, dict):
+                return {_serialize(k): _serialize(v) for k, v in obj.items()}
             elif isinstance(obj, (list, tuple)):
                 return [_serialize(item) for item in obj]
-            else:
+            elif isinstance(obj, set):
+                return {_serialize(item) for item in obj}
+            elif type(obj) in (bool, str, int, float, type(None)):
                 return obj
+            else:
+                return '{} <class \'{}\'>'.format(str(obj), obj.__class__.__name__)
 
         serializable_dic = _serialize({
             k: v for k, v in self.to_dict(alphabetical=True).items() if k not in ignored_keys
@@ -399,11 +578,24 @@ class Config(OrderedDict):
 
         os.makedirs(op.dirname(save_path), exist_ok=True)
         with open(save_path, 'w') as fp:
-            yaml.dump(serializable_dic, fp)
+            yaml.dump(serializable_dic, fp, Dumper=_YamlDumper)
 
     def copy(self):
         """ Create a deep copy of the Config object """
-        return Config(deepcopy(self.to_dict()))
+
+        def _clone(obj):
+            if isinstance(obj, dict):
+                cfg = Config()
+                cfg._unchecked_update((k, _clone(v)) for k, v in obj.items())
+                return cfg
+            elif isinstance(obj, (list, tuple)):
+                return tuple(_clone(item) for item in obj)
+            else:
+                return self._copy_leaf(obj)
+
+        cfg = _clone(self)
+        cfg.freeze()
+        return cfg
 
     # ---------------- Misc ----------------
 
@@ -413,6 +605,15 @@ class Config(OrderedDict):
     def __deepcopy__(self, memo):
         return self.copy()
 
+    def __reduce__(self):
+        # slots would otherwise be restored through __setattr__, i.e. as keys
+        state = {name: getattr(self, name) for name in Config.__slots__}
+        return self.__class__, (), state, None, iter(self.items())
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __repr__(self):
         return self.to_dict().__repr__()
 
@@ -420,22 +621,25 @@ class Config(OrderedDict):
         return self.to_dict().__repr__()
 
     def string(self, alphabetical=False, ignored_keys=(), key_width=30, indent=0):
-        ignored_keys = set(ignored_keys)
+        ignored_keys = set(ignored_keys or ())
+        texts = []
 
         def _to_string(dic, idt=indent):
-            texts = []
-            keys = sorted(dic.keys()) if alphabetical else dic.keys()
-            keys = [k for k in keys if k not in ignored_keys]
+            """ Append lines of a (nested) Config into the shared buffer """
+            keys = dic._sorted_keys() if alphabetical else dic.keys()
             for k in keys:
-                title = ' ' * idt + str(k) + ':'
-                texts += ['{:<{}}'.format(title, key_width + idt)]
-                if not isinstance(dic[k], Config):
-                    texts[-1] += str(dic[k])
+                if k in ignored_keys:
+                    continue
+                v = dic[k]
+                title = '{:<{}}'.format(' ' * idt + str(k) + ':', key_width + idt)
+                if isinstance(v, Config):
+                    texts.append(title)
+                    _to_string(v, idt=idt + 2)
                 else:
-                    texts += _to_string(dic[k], idt=idt + 2)
-            return texts
+                    texts.append(title + str(v))
 
-        return '\n'.join(_to_string(self))
+        _to_string(self)
+        return '\n'.join(texts)
 
     def print(self, streamer=print, alphabetical=False, ignored_keys=None, key_width=40, indent=0):
         return streamer(self.string(alphabetical, ignored_keys, key_width, indent))
@@ -451,17 +655,125 @@ class Config(OrderedDict):
             )
 
         del self[key]
+        object.__setattr__(self, '__version__', self.__version__ + 1)
 
     # ---------------- Helpers ----------------
 
     @classmethod
-    def _from_dict(cls, dic):
-        dic = deepcopy(OrderedDict(dic))
-        for k, v in dic.items():
+    def _from_dict(cls, dic, copy_leaves=False):
+        """
+        Build an unfrozen Config from a (nested) dict in a single pass, in
+        which children dicts are wrapped into Config objects directly.
+
+        :param copy_leaves: whether to deepcopy the non-dict values. Only
+            required if `dic` is owned by the caller; freshly parsed yaml or
+            argparse contents could be taken over as they are
+        """
+
+        def _leaf(v):
+            return cls._copy_leaf(v) if copy_leaves else v
+
+        def _convert(v):
             if isinstance(v, dict):
-                dic[k] = cls(v)
+                return cls._from_dict(v, copy_leaves)
             elif isinstance(v, (list, tuple)):  # load list as tuple for safety
-                dic[k] = tuple(cls(x) if isinstance(x, dict) else x for x in v)
+                return tuple(_convert(x) if isinstance(x, dict) else _leaf(x) for x in v)
+            else:
+                return _leaf(v)
+
+        cfg = cls()
+        cfg._unchecked_update(
+            # share key strings across nodes
+            (sys.intern(k) if type(k) is str else k, _convert(v)) for k, v in dic.items()
+        )
+
+        return cfg
+
+    def _sorted_keys(self):
+        """
+        Alphabetically sorted keys, cached until this Config is modified.
+        The length check catches deletions that bypass remove().
+        """
+
+        cache = self.__sorted_keys__
+        if cache is None or cache[0] != self.__version__ or len(cache[1]) != len(self):
+            cache = (self.__version__, sorted(self.keys()))
+            object.__setattr__(self, '__sorted_keys__', cache)
+
+        return cache[1]
+
+    def _tree_version(self):
+        """
+        Collect the versions of all Config objects in the tree. Any tracked
+        mutation bumps the version of the mutated node, so an unchanged
+        stamp means an unchanged tree.
+        """
+
+        stamp = []
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, dict):
+                if isinstance(obj, Config):
+                    stamp.append(obj.__version__)
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple)):
+                stack.extend(obj)
+
+        return tuple(stamp)
+
+    @staticmethod
+    def _is_yaml_stream(obj):
+        """ Whether obj is the raw bytes or an opened file object of a yaml """
+
+        if isinstance(obj, bytes):
+            return True
+        if isinstance(obj, (dict, argparse.Namespace)):
+            return False
+        return callable(getattr(obj, 'read', None))
+
+    @staticmethod
+    def _copy_leaf(v):
+        """
+        Deepcopy a non-Config value, unless it is immutable (or a tuple of
+        immutables) and thus could be shared as it is.
+        """
+
+        if isinstance(v, _IMMUTABLE_TYPES):
+            return v
+        if isinstance(v, tuple) and all(isinstance(x, _IMMUTABLE_TYPES) for x in v):
+            return v
+        return deepcopy(v)
+
+    @staticmethod
+    def _load_yaml(yaml_path, stat, use_cache):
+        """
+        Parse a yaml file, optionally going through its pickled sidecar.
+        Reading or writing the sidecar is best-effort: any failure (e.g. a
+        read-only filesystem) falls back to parsing the yaml.
+        """
+
+        cache_path = f'{yaml_path}.pkl'
+
+        if use_cache and op.isfile(cache_path) and \
+                os.stat(cache_path).st_mtime_ns >= stat.st_mtime_ns:
+            try:
+                with open(cache_path, 'rb') as fp:
+                    dic = pickle.load(fp)
+            except Exception:  # a corrupted sidecar could fail in any way
+                dic = None
+            if isinstance(dic, dict):
+                return dic
+
+        with open(yaml_path, 'rb') as fp:
+            dic = yaml.load(fp, Loader=_YamlLoader)
+
+        if use_cache:
+            try:
+                with open(cache_path, 'wb') as fp:
+                    pickle.dump(dic, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            except (OSError, pickle.PicklingError):
+                pass
 
         return dic
 
@@ -498,25 +810,16 @@ class Config(OrderedDict):
         :return: a nested dict
         """
 
-        def _init_nested_dict():
-            return defaultdict(_init_nested_dict)
+        nested_dict = {}
 
-        def _default_to_dict(d):
-            """ Convert a defaultdict object into a regular dict """
-            if isinstance(d, defaultdict):
-                d = {kk: _default_to_dict(vv) for kk, vv in d.items()}
-            return d
-
-        nested_dict = _init_nested_dict()
-
-        for k, v in deepcopy(separator_dict).items():
+        for k, v in separator_dict.items():
             tmp_d = nested_dict
             keys = k.split(separator)
             for sub_key in keys[:-1]:
-                tmp_d = tmp_d[sub_key]
-            tmp_d[keys[-1]] = v
+                tmp_d = tmp_d.setdefault(sub_key, {})
+            tmp_d[keys[-1]] = Config._copy_leaf(v)
 
-        return _default_to_dict(nested_dict)
+        return nested_dict
 
     @staticmethod
     def _nested_dict_to_separator_dict(nested_dict, separator='.'):